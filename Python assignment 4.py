@@ -1,51 +1,136 @@
 # weather_visualizer.py
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless: figures are only saved, never shown
 import matplotlib.pyplot as plt
 
+# let Agg merge nearly collinear segments on long line plots
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+
 # -------------------------
 
 # -------------------------
 INPUT_CSV = "wheather_data.csv.csv"  
 CLEANED_CSV = "cleaned_weather.csv"
 OUTPUT_DIR = "weather_outputs"
+CLEANED_PARQUET = os.path.join(OUTPUT_DIR, "cleaned_weather.parquet")
+EXPORT_CSV = True  # also write CSV copies of the cleaned data and monthly aggregates
+LINE_MAX_POINTS = 10_000  # above this, plot the temperature trend as daily means
+SCATTER_MAX_POINTS = 50_000  # above this, bin humidity vs temperature instead of scattering
 SUMMARY_FILE = os.path.join(OUTPUT_DIR, "summary_report.txt")
 
+# Month-end resample alias: 'ME' since pandas 2.2 ('M' is removed in pandas 3)
+MONTH_END = 'ME' if tuple(int(p) for p in pd.__version__.split('.')[:2]) >= (2, 2) else 'M'
+
 # Ensure output dir exists
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Compiled once and reused for every column in basic_cleaning
+NON_NUMERIC_RE = re.compile(r'[^\d\.\-]')
+# digits with optional '-' or '/' separators, e.g. 2024-01-31 or 31/01/2024
+DATE_LIKE_RE = re.compile(r'[\-/]*\d[\d\-/]*')
+# Column-name patterns for the key weather variables (names are lowercased by basic_cleaning)
+TEMP_RE = re.compile(r'temp|t_avg|t_mean|tmax|tmin')
+RAIN_RE = re.compile(r'rain|precip|ppt')
+HUM_RE = re.compile(r'humid|rh')
+# Explicit formats tried before falling back to pandas' per-row inference.
+# Ambiguous numeric dates are read day-first, matching the fallback.
+DATE_FORMATS = (
+    '%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S',
+    '%Y/%m/%d', '%d/%m/%Y', '%d-%m-%Y', '%d.%m.%Y',
+    '%d/%m/%Y %H:%M', '%d-%m-%Y %H:%M',
+)
+
 # -------------------------
 # Helper functions
 # -------------------------
+def matches_c_engine(df):
+    """Return True if pyarrow typed every column the way the C engine would."""
+    date_col = detect_date_column(df)
+    for c in df.columns:
+        # non-string objects (time, date, bytes from non-UTF-8 files) and
+        # timestamps outside the date column come back as text from the C engine
+        if df[c].dtype == object and pd.api.types.infer_dtype(df[c], skipna=True) not in ('string', 'empty'):
+            return False
+        if pd.api.types.is_datetime64_any_dtype(df[c]) and c != date_col:
+            return False
+    return True
+
 def safe_read_csv(path):
-    """Read CSV with common encodings and return DataFrame."""
+    """Read CSV with common encodings and return DataFrame.
+
+    Uses pandas' multithreaded pyarrow engine when pyarrow is installed and
+    falls back to the C engine otherwise, or when pyarrow rejects the file or
+    types a column differently from it.
+    """
     try:
-        df = pd.read_csv(path)
+        try:
+            df = pd.read_csv(path, engine='pyarrow')
+            if not matches_c_engine(df):
+                df = None  # re-read so the values don't depend on pyarrow
+        except ImportError:
+            df = None  # pyarrow not installed
+        except ValueError:
+            df = None  # pyarrow rejected the layout (e.g. ragged rows); the C engine is more lenient
+        if df is None:
+            df = pd.read_csv(path, engine='c')
         return df
     except UnicodeDecodeError:
-        return pd.read_csv(path, encoding='latin1')
+        # non-UTF-8 files (e.g. 'Zürich' saved as latin1) end up here via the
+        # bytes check above; latin1 maps every byte, so this read always decodes
+        return pd.read_csv(path, engine='c', encoding='latin1')
     except Exception as e:
         print(f"Error reading {path}: {e}")
         sys.exit(1)
 
 def detect_date_column(df):
     """Try to detect a date column name from common names."""
-    candidates = [c for c in df.columns if 'date' in c.lower() or 'time' in c.lower()]
+    cols_low = {c: str(c).lower() for c in df.columns}
+    candidates = [c for c, low in cols_low.items() if 'date' in low or 'time' in low]
     if candidates:
         return candidates[0]
 
     first = df.columns[0]
-    sample = df[first].astype(str).iloc[:5].str.replace('-', '').str.replace('/', '')
-    if sample.str.isnumeric().any():
+    # the pyarrow reader may already have parsed ISO dates
+    if pd.api.types.is_datetime64_any_dtype(df[first]):
+        return first
+    head = df[first].iloc[:5].to_numpy(dtype=object)
+    if any(DATE_LIKE_RE.fullmatch(str(x)) for x in head):
         return first
     return None
 
+def sniff_date_format(sample):
+    """Return the first of DATE_FORMATS that parses sample, or None."""
+    for fmt in DATE_FORMATS:
+        try:
+            datetime.strptime(sample, fmt)
+            return fmt
+        except ValueError:
+            continue
+    return None
+
 def parse_dates(df, date_col):
     """Convert date column to datetime, create day/month/year columns."""
-    df[date_col] = pd.to_datetime(df[date_col], errors='coerce', dayfirst=True)
+    raw = df[date_col]
+    parsed = None
+    if not pd.api.types.is_datetime64_any_dtype(raw):
+        non_null = raw.dropna()
+        fmt = sniff_date_format(str(non_null.iloc[0]).strip()) if not non_null.empty else None
+        if fmt is not None:
+            parsed = pd.to_datetime(raw, format=fmt, errors='coerce', cache=True)
+            # mixed formats in the column: let pandas infer them row by row instead
+            if parsed.isna().sum() > raw.isna().sum():
+                parsed = None
+    if parsed is None:
+        parsed = pd.to_datetime(raw, errors='coerce', dayfirst=True)
+    df[date_col] = parsed
     
     df = df.dropna(subset=[date_col]).copy()
     df['year'] = df[date_col].dt.year
@@ -58,51 +143,101 @@ def basic_cleaning(df):
     """Lowercase column names, strip spaces, convert numeric-like cols to numeric."""
     df.columns = [c.strip().lower().replace(' ', '_') for c in df.columns]
     
-    for c in df.columns:
-        
-        if df[c].dtype == object:
-        
-            coerced = pd.to_numeric(df[c].str.replace('[^\d\.\-]', '', regex=True), errors='coerce')
-            # if lots of numeric present, replace
-            if coerced.notna().sum() > len(df) * 0.1:
-                df[c] = coerced
+    # columns the reader already typed (numbers, dates, times) need no coercion;
+    # object storage alone doesn't mean the values are text, so check the contents
+    converted = []
+    for c in df.select_dtypes(include=['object', 'string']).columns:
+        if pd.api.types.infer_dtype(df[c], skipna=True) != 'string':
+            continue
+        coerced = pd.to_numeric(df[c].str.replace(NON_NUMERIC_RE, '', regex=True), errors='coerce')
+        # if lots of numeric present, replace
+        if coerced.notna().sum() > len(df) * 0.1:
+            df[c] = coerced
+            converted.append(c)
+    if converted:
+        print("Converted text columns to numeric:", converted)
     return df
 
-def fill_missing(df, strategy_cols=None):
+def fill_missing(df, numeric_cols, cat_cols):
     """Fill NaNs: numeric -> interpolate then fill with mean; categorical -> fill mode."""
     # interpolate numeric columns
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    df[numeric_cols] = df[numeric_cols].interpolate(limit_direction='both')
-    # fill remaining numeric NaNs with column mean
-    for c in numeric_cols:
-        if df[c].isna().any():
-            df[c] = df[c].fillna(df[c].mean())
+    df[numeric_cols] = df[numeric_cols].interpolate(method='linear', limit_direction='both', axis=0)
+    # fill remaining numeric NaNs with column mean (one pass over all columns;
+    # a no-op on columns without NaNs, so no per-column check is needed)
+    df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].mean())
     # categorical columns
-    cat_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
     for c in cat_cols:
         if df[c].isna().any():
-            df[c] = df[c].fillna(df[c].mode().iloc[0] if not df[c].mode().empty else "")
+            mode = df[c].mode()
+            df[c] = df[c].fillna(mode.iloc[0] if not mode.empty else "")
     return df
 
 def compute_statistics(df, numeric_cols):
-    stats = {}
-    for c in numeric_cols:
-        col = df[c].dropna()
-        if col.empty:
-            continue
-        stats[c] = {
-            'mean': float(np.mean(col)),
-            'min': float(np.min(col)),
-            'max': float(np.max(col)),
-            'std': float(np.std(col, ddof=1))
-        }
-    return stats
+    if not numeric_cols:
+        return {}
+    # describe() computes all the stats in one pass; skip all-NaN columns
+    table = df[numeric_cols].describe(percentiles=[]).T[['mean', 'min', 'max', 'std']]
+    table = table.dropna(subset=['mean'])
+    return table.to_dict(orient='index')
 
 def save_plot(fig, name):
     path = os.path.join(OUTPUT_DIR, name)
     fig.savefig(path, bbox_inches='tight')
     print(f"Saved plot: {path}")
 
+# The plot functions below take plain NumPy arrays so they can be pickled
+# and rendered in worker processes.
+def plot_daily_temp(dates, temps, ylabel):
+    fig, ax = plt.subplots(figsize=(10,4))
+    ax.plot(dates, temps)
+    ax.set_title("Daily Temperature Trend")
+    ax.set_xlabel("Date")
+    ax.set_ylabel(ylabel)
+    fig.autofmt_xdate()
+    save_plot(fig, "daily_temperature_trend.png")
+    plt.close(fig)
+
+def plot_monthly_rain(month_labels, totals, ylabel):
+    fig, ax = plt.subplots(figsize=(10,4))
+    ax.bar(month_labels, totals)
+    ax.set_title("Monthly Rainfall Totals")
+    ax.set_xlabel("Month")
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis='x', rotation=45)
+    save_plot(fig, "monthly_rainfall_totals.png")
+    plt.close(fig)
+
+def plot_humidity_vs_temp(temps, humidity, xlabel, ylabel):
+    fig, ax = plt.subplots(figsize=(6,6))
+    if len(temps) > SCATTER_MAX_POINTS:
+        # one glyph per row is too slow for large files; aggregate into hex cells
+        hb = ax.hexbin(temps, humidity, gridsize=100, mincnt=1, cmap='viridis')
+        fig.colorbar(hb, ax=ax, label="Count")
+    else:
+        ax.scatter(temps, humidity, alpha=0.6)
+    ax.set_title("Humidity vs Temperature")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    save_plot(fig, "humidity_vs_temperature.png")
+    plt.close(fig)
+
+def plot_combined_monthly(months, mean_temps, month_labels, totals, temp_label, rain_label):
+    fig, axes = plt.subplots(1,2, figsize=(14,4))
+    axes[0].plot(months, mean_temps)
+    axes[0].set_title("Monthly Mean Temperature")
+    axes[0].set_xlabel("Month")
+    axes[0].set_ylabel(temp_label)
+    axes[0].tick_params(axis='x', rotation=45)
+
+    axes[1].bar(month_labels, totals)
+    axes[1].set_title("Monthly Total Rainfall")
+    axes[1].set_xlabel("Month")
+    axes[1].set_ylabel(rain_label)
+    axes[1].tick_params(axis='x', rotation=45)
+
+    save_plot(fig, "combined_monthly_temp_rain.png")
+    plt.close(fig)
+
 # -------------------------
 # Main process
 # -------------------------
@@ -127,154 +262,176 @@ def main():
 
     # 3. Clean columns
     df = basic_cleaning(df)
+    # column types don't change after cleaning, so look them up once
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    cat_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
 
     # 4. Try to identify likely important columns
     cols = df.columns.tolist()
-    # common names mapping
-    def find_col(keywords):
-        for k in keywords:
-            for c in cols:
-                if k in c:
-                    return c
-        return None
-
-    temp_col = find_col(['temp', 'temperature', 't_avg', 't_mean', 'tmax', 'tmin'])
-    rain_col = find_col(['rain', 'precip', 'ppt', 'rainfall'])
-    humidity_col = find_col(['humid', 'rh', 'relative_humidity'])
+    # first column whose name matches the category pattern
+    def find_col(pat):
+        return next((c for c in cols if pat.search(c)), None)
+
+    temp_col = find_col(TEMP_RE)
+    rain_col = find_col(RAIN_RE)
+    humidity_col = find_col(HUM_RE)
 
     print("Detected columns -> temperature:", temp_col, "rainfall:", rain_col, "humidity:", humidity_col)
 
     # 5. Fill missing
-    df = fill_missing(df)
+    df = fill_missing(df, numeric_cols, cat_cols)
 
     # 6. Compute stats
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     stats = compute_statistics(df, numeric_cols)
 
-    # 7. Save cleaned CSV
-    df.reset_index(inplace=True)  # make date a column again for saving
-    df.to_csv(CLEANED_CSV, index=False)
-    print(f"Cleaned data saved to {CLEANED_CSV}")
-
-    # 8. Plots
-    # Re-index by date if needed
-    df[date_col] = pd.to_datetime(df[date_col])
-    df = df.set_index(date_col)
-
-    # (A) Line chart: daily temperature trend (if temperature column exists)
-    if temp_col and temp_col in df.columns:
-        fig, ax = plt.subplots(figsize=(10,4))
-        ax.plot(df.index, df[temp_col])
-        ax.set_title("Daily Temperature Trend")
-        ax.set_xlabel("Date")
-        ax.set_ylabel(temp_col.replace('_',' ').title())
-        fig.autofmt_xdate()
-        save_plot(fig, "daily_temperature_trend.png")
-        plt.close(fig)
-    else:
-        print("Temperature column not found — skipping daily temperature plot.")
-
-    # (B) Bar chart: monthly rainfall totals (if rainfall column exists)
-    if rain_col and rain_col in df.columns:
-        monthly_rain = df[rain_col].resample('M').sum()
-        fig, ax = plt.subplots(figsize=(10,4))
-        ax.bar(monthly_rain.index.strftime("%Y-%m"), monthly_rain.values)
-        ax.set_title("Monthly Rainfall Totals")
-        ax.set_xlabel("Month")
-        ax.set_ylabel(f"Total {rain_col}")
-        plt.xticks(rotation=45)
-        save_plot(fig, "monthly_rainfall_totals.png")
-        plt.close(fig)
-    else:
-        print("Rainfall column not found — skipping monthly rainfall plot.")
-
-    # (C) Scatter: humidity vs temperature
-    if temp_col and humidity_col and temp_col in df.columns and humidity_col in df.columns:
-        subset = df[[temp_col, humidity_col]].dropna()
-        fig, ax = plt.subplots(figsize=(6,6))
-        ax.scatter(subset[temp_col], subset[humidity_col], alpha=0.6)
-        ax.set_title("Humidity vs Temperature")
-        ax.set_xlabel(temp_col.replace('_',' ').title())
-        ax.set_ylabel(humidity_col.replace('_',' ').title())
-        save_plot(fig, "humidity_vs_temperature.png")
-        plt.close(fig)
-    else:
-        print("Temperature or humidity column missing — skipping scatter plot.")
-
-
-
-    combined_created = False
+    # 7. Save cleaned data (Parquet, plus CSV if EXPORT_CSV)
+    # the DatetimeIndex from parse_dates is written out as the date column
+    parquet_written = False
     try:
-        monthly_mean_temp = df[temp_col].resample('M').mean() if temp_col in df.columns else None
-        monthly_total_rain = df[rain_col].resample('M').sum() if rain_col in df.columns else None
-
-        if monthly_mean_temp is not None and monthly_total_rain is not None:
-            fig, axes = plt.subplots(1,2, figsize=(14,4))
-            axes[0].plot(monthly_mean_temp.index, monthly_mean_temp.values)
-            axes[0].set_title("Monthly Mean Temperature")
-            axes[0].set_xlabel("Month")
-            axes[0].set_ylabel(temp_col.replace('_',' ').title())
-            axes[0].tick_params(axis='x', rotation=45)
-
-            axes[1].bar(monthly_total_rain.index.strftime("%Y-%m"), monthly_total_rain.values)
-            axes[1].set_title("Monthly Total Rainfall")
-            axes[1].set_xlabel("Month")
-            axes[1].set_ylabel(f"Total {rain_col}")
-            axes[1].tick_params(axis='x', rotation=45)
-
-            save_plot(fig, "combined_monthly_temp_rain.png")
-            plt.close(fig)
-            combined_created = True
-    except Exception as e:
-        print("Error creating combined plot:", e)
-
-    if not combined_created:
-        print("Combined monthly plot skipped (missing temp or rainfall).")
+        df.to_parquet(CLEANED_PARQUET, engine='pyarrow', compression='snappy', index=True)
+        parquet_written = True
+        print(f"Cleaned data saved to {CLEANED_PARQUET}")
+    except ImportError as e:
+        print("Parquet export skipped (pyarrow not installed):", e)
+    if EXPORT_CSV:
+        df.to_csv(CLEANED_CSV, index=True, index_label=date_col)
+        print(f"Cleaned data saved to {CLEANED_CSV}")
 
-    
-    agg_table = None
+    # 8. Plots
+    # Monthly aggregates: a single resample pass shared by the plots and the CSV
+    agg_map = {}
+    if temp_col in df.columns:
+        agg_map[temp_col] = ['mean', 'min', 'max']
+    if rain_col in df.columns:
+        agg_map[rain_col] = ['sum', 'mean']
+    if humidity_col in df.columns:
+        agg_map[humidity_col] = ['mean']
+
+    monthly = None
     try:
-        agg_table = df.resample('M').agg({
-            temp_col: ['mean','min','max'] if temp_col in df.columns else {},
-            rain_col: ['sum','mean'] if rain_col in df.columns else {},
-            humidity_col: ['mean'] if humidity_col in df.columns else {}
-        })
-        # flatten columns
-        agg_table.columns = ['_'.join(filter(None, map(str, col))).strip() for col in agg_table.columns.values]
-        agg_csv_path = os.path.join(OUTPUT_DIR, "monthly_aggregates.csv")
-        agg_table.to_csv(agg_csv_path)
-        print(f"Monthly aggregates saved to {agg_csv_path}")
+        if agg_map:
+            monthly = df.resample(MONTH_END).agg(agg_map)
     except Exception as e:
         print("Could not compute monthly aggregates:", e)
 
+    monthly_mean_temp = monthly[(temp_col, 'mean')] if monthly is not None and temp_col in agg_map else None
+    monthly_total_rain = monthly[(rain_col, 'sum')] if monthly is not None and rain_col in agg_map else None
+
+    # The four figures are independent, so render them in parallel worker processes
+    tasks = {}
+    with ProcessPoolExecutor(max_workers=4) as ex:
+        # (A) Line chart: daily temperature trend (if temperature column exists)
+        if temp_col and temp_col in df.columns:
+            temp_series = df[temp_col]
+            if len(temp_series) > LINE_MAX_POINTS:
+                # sub-daily data: one point per day is enough for the trend line
+                temp_series = temp_series.resample('D').mean()
+            tasks["daily temperature"] = ex.submit(
+                plot_daily_temp, temp_series.index.to_numpy(), temp_series.to_numpy(),
+                temp_col.replace('_',' ').title())
+        else:
+            print("Temperature column not found — skipping daily temperature plot.")
+
+        # (B) Bar chart: monthly rainfall totals (if rainfall column exists)
+        if monthly_total_rain is not None:
+            rain_labels = monthly_total_rain.index.strftime("%Y-%m").to_numpy()
+            tasks["monthly rainfall"] = ex.submit(
+                plot_monthly_rain, rain_labels, monthly_total_rain.to_numpy(), f"Total {rain_col}")
+        elif rain_col in df.columns:
+            # column exists but the monthly resample failed (already reported above)
+            print("Monthly aggregates unavailable — skipping monthly rainfall plot.")
+        else:
+            print("Rainfall column not found — skipping monthly rainfall plot.")
+
+        # (C) Scatter: humidity vs temperature
+        if temp_col and humidity_col and temp_col in df.columns and humidity_col in df.columns:
+            subset = df[[temp_col, humidity_col]].dropna()
+            tasks["humidity vs temperature"] = ex.submit(
+                plot_humidity_vs_temp, subset[temp_col].to_numpy(), subset[humidity_col].to_numpy(),
+                temp_col.replace('_',' ').title(), humidity_col.replace('_',' ').title())
+        else:
+            print("Temperature or humidity column missing — skipping scatter plot.")
+
+        # (D) Combined monthly temperature and rainfall
+        if monthly_mean_temp is not None and monthly_total_rain is not None:
+            tasks["combined"] = ex.submit(
+                plot_combined_monthly, monthly_mean_temp.index.to_numpy(), monthly_mean_temp.to_numpy(),
+                rain_labels, monthly_total_rain.to_numpy(),
+                temp_col.replace('_',' ').title(), f"Total {rain_col}")
+
+        failed = set()
+        for name, fut in tasks.items():
+            try:
+                fut.result()
+            except Exception as e:
+                print(f"Error creating {name} plot:", e)
+                failed.add(name)
+
+    # a failed combined plot was already reported by name above
+    if "combined" not in tasks:
+        if monthly is None and temp_col in df.columns and rain_col in df.columns:
+            print("Combined monthly plot skipped (monthly aggregates unavailable).")
+        else:
+            print("Combined monthly plot skipped (missing temp or rainfall).")
+
+    if monthly is not None:
+        try:
+            # flatten columns
+            flat_cols = ['_'.join(filter(None, map(str, col))).strip() for col in monthly.columns.values]
+            agg_table = monthly.set_axis(flat_cols, axis=1)
+            agg_parquet_path = os.path.join(OUTPUT_DIR, "monthly_aggregates.parquet")
+            try:
+                agg_table.to_parquet(agg_parquet_path, engine='pyarrow', compression='snappy')
+                print(f"Monthly aggregates saved to {agg_parquet_path}")
+            except ImportError as e:
+                print("Parquet export skipped (pyarrow not installed):", e)
+            if EXPORT_CSV:
+                agg_csv_path = os.path.join(OUTPUT_DIR, "monthly_aggregates.csv")
+                agg_table.to_csv(agg_csv_path)
+                print(f"Monthly aggregates saved to {agg_csv_path}")
+        except Exception as e:
+            print("Could not save monthly aggregates:", e)
+
     # 10. Create summary report
+    report = [
+        "Weather Data Visualizer - Summary Report\n",
+        f"Generated on: {datetime.now().isoformat()}\n\n",
+        "Input file: " + INPUT_CSV + "\n",
+    ]
+    if parquet_written:
+        report.append("Cleaned file: " + CLEANED_PARQUET + "\n")
+    if EXPORT_CSV:
+        report.append("Cleaned CSV: " + CLEANED_CSV + "\n")
+    report.append("\n")
+
+    report += [
+        "Detected key columns:\n",
+        f"  Temperature column: {temp_col}\n",
+        f"  Rainfall column: {rain_col}\n",
+        f"  Humidity column: {humidity_col}\n\n",
+        "Basic numeric statistics (sample):\n",
+    ]
+    report += [
+        f"- {col}: mean={s['mean']:.3f}, min={s['min']:.3f}, max={s['max']:.3f}, std={s['std']:.3f}\n"
+        for col, s in stats.items()
+    ]
+    report += [
+        "\nGenerated plots (saved in output folder):\n",
+        "  - daily_temperature_trend.png\n",
+        "  - monthly_rainfall_totals.png\n",
+        "  - humidity_vs_temperature.png\n",
+        "  - combined_monthly_temp_rain.png\n",
+        "\nNotes:\n",
+        " - Missing numeric values were interpolated then filled with column means if necessary.\n",
+        " - Date parsing used day-first convention; if your dates are in another format, adjust parse logic.\n",
+        "\nEnd of report.\n",
+    ]
+
     with open(SUMMARY_FILE, 'w', encoding='utf-8') as f:
-        f.write("Weather Data Visualizer - Summary Report\n")
-        f.write(f"Generated on: {datetime.now().isoformat()}\n\n")
-        f.write("Input file: " + INPUT_CSV + "\n")
-        f.write("Cleaned file: " + CLEANED_CSV + "\n\n")
-
-        f.write("Detected key columns:\n")
-        f.write(f"  Temperature column: {temp_col}\n")
-        f.write(f"  Rainfall column: {rain_col}\n")
-        f.write(f"  Humidity column: {humidity_col}\n\n")
-
-        f.write("Basic numeric statistics (sample):\n")
-        for col, s in stats.items():
-            f.write(f"- {col}: mean={s['mean']:.3f}, min={s['min']:.3f}, max={s['max']:.3f}, std={s['std']:.3f}\n")
-
-        f.write("\nGenerated plots (saved in output folder):\n")
-        f.write("  - daily_temperature_trend.png\n")
-        f.write("  - monthly_rainfall_totals.png\n")
-        f.write("  - humidity_vs_temperature.png\n")
-        f.write("  - combined_monthly_temp_rain.png\n")
-        f.write("\nNotes:\n")
-        f.write(" - Missing numeric values were interpolated then filled with column means if necessary.\n")
-        f.write(" - Date parsing used day-first convention; if your dates are in another format, adjust parse logic.\n")
-        f.write("\nEnd of report.\n")
+        f.write(''.join(report))
 
     print(f"Summary report saved to {SUMMARY_FILE}")
-    print("All done. Check the outputs folder for images and the cleaned CSV.")
+    print("All done. Check the outputs folder for images and the cleaned data.")
 
 if __name__ == "__main__":
     main()